@@ -32,7 +32,10 @@ import sys
 import shutil
 import platform
 import traceback
-from typing import Optional
+from contextlib import redirect_stderr, redirect_stdout
+from functools import lru_cache
+from itertools import groupby
+from typing import List, Optional, Tuple
 
 import maya.cmds as cmds
 import maya.mel as mel
@@ -47,10 +50,13 @@ END_MARKER = "# END_ATLAS_SCULPTOR"
 # ---------- FUNCTIONS ----------
 
 
+@lru_cache(maxsize=256)
 def _norm(p: str) -> str:
     """
     Normalize a file path to use forward slashes and absolute form.
 
+    Results are cached, as the installer normalizes the same paths repeatedly.
+
     Args:
         p (str): The path to normalize.
 
@@ -80,10 +86,13 @@ def get_maya_version() -> str:
     return cmds.about(version=True)
 
 
+@lru_cache(maxsize=None)
 def get_maya_prefs_dir(maya_version: str, user_platform: str) -> str:
     """
     Get Maya preferences directory based on platform and version.
 
+    The result is cached, so the OneDrive probe on Windows runs only once.
+
     Args:
         maya_version (str): Maya version string (e.g., '2024').
         user_platform (str): Operating system name ('Windows', 'Darwin', 'Linux').
@@ -97,9 +106,10 @@ def get_maya_prefs_dir(maya_version: str, user_platform: str) -> str:
         onedrive_path = os.path.join(user_profile, "OneDrive", "Documents", "maya", maya_version)
         local_path = os.path.join(user_profile, "Documents", "maya", maya_version)
 
-        if os.path.exists(onedrive_path):
+        try:
+            os.stat(onedrive_path)
             return onedrive_path
-        else:
+        except OSError:
             return local_path
     elif user_platform == "Darwin":  # Mac
         return os.path.expanduser(f"~/Library/Preferences/Autodesk/maya/{maya_version}")
@@ -107,61 +117,65 @@ def get_maya_prefs_dir(maya_version: str, user_platform: str) -> str:
         return os.path.expanduser(f"~/maya/{maya_version}")
 
 
-def _remove_existing_block(filepath: str, start_marker: str, end_marker: str) -> str:
+def _remove_existing_block(filepath: str, markers: List[Tuple[str, str]]) -> str:
     """
-    Remove existing marked block from a file and return cleaned content.
+    Remove existing marked blocks from a file and return cleaned content.
+
+    The file is read once and each block is located with substring searches.
 
     Args:
         filepath (str): Path to the file to clean.
-        start_marker (str): Starting marker line to identify block.
-        end_marker (str): Ending marker line to identify block.
+        markers (List[Tuple[str, str]]): (start_marker, end_marker) pairs identifying blocks.
 
     Returns:
-        str: File content with marked block removed, or empty string if file doesn't exist.
+        str: File content with marked blocks removed, or empty string if file doesn't exist.
     """
-    if not os.path.exists(filepath):
+    try:
+        with open(filepath, "r", encoding="utf-8") as f:
+            data = f.read()
+    except FileNotFoundError:
         return ""
 
-    with open(filepath, "r", encoding="utf-8") as f:
-        lines = f.readlines()
-
-    new_lines = []
-    skip_mode = False
-
-    for line in lines:
-        if start_marker in line:
-            skip_mode = True
-            continue
-        if skip_mode and end_marker in line:
-            skip_mode = False
-            continue
-        if not skip_mode:
-            new_lines.append(line)
-
-    return "".join(new_lines)
-
-
-def _append_block(filepath: str, start_marker: str, end_marker: str, content: str) -> None:
+    for start_marker, end_marker in markers:
+        while True:
+            i = data.find(start_marker)
+            if i == -1:
+                break
+            # Drop whole lines, from the start marker line to the end marker line
+            line_start = data.rfind("\n", 0, i) + 1
+            j = data.find(end_marker, data.find("\n", i) + 1 or len(data))
+            if j == -1:
+                # Unterminated block runs to end of file
+                data = data[:line_start]
+                break
+            line_end = data.find("\n", j) + 1 or len(data)
+            data = data[:line_start] + data[line_end:]
+
+    return data
+
+
+def _append_blocks(filepath: str, edits: List[Tuple[str, str, str]]) -> None:
     """
-    Remove any existing marked block, then append new block to file.
+    Remove any existing marked blocks, then append new blocks to file.
+
+    The file is read once and written once regardless of the number of blocks.
 
     Args:
         filepath (str): Path to the file to modify.
-        start_marker (str): Starting marker for the block.
-        end_marker (str): Ending marker for the block.
-        content (str): Content to append (should include markers).
+        edits (List[Tuple[str, str, str]]): (start_marker, end_marker, content) triples,
+            where content should include markers.
     """
-    # Remove existing block first
-    existing = _remove_existing_block(filepath, start_marker, end_marker)
+    # Remove existing blocks first
+    existing = _remove_existing_block(filepath, [(start, end) for start, end, _ in edits])
 
-    # Write cleaned content plus new block
+    # Write cleaned content plus new blocks
     with open(filepath, "w", encoding="utf-8") as f:
         f.write(existing)
         if existing and not existing.endswith("\n"):
             f.write("\n")
-        f.write("\n" + content)
+        f.write("\n" + "\n".join(content for _, _, content in edits))
 
-    print(f"Updated {os.path.basename(filepath)} with new block")
+    print(f"Updated {os.path.basename(filepath)} with new blocks")
 
 
 def write_usersetup_blocks(tools_dir: str, maya_scripts_dir: str) -> None:
@@ -172,11 +186,11 @@ def write_usersetup_blocks(tools_dir: str, maya_scripts_dir: str) -> None:
     then appends fresh configuration.
 
     Args:
-        tools_dir (str): Path to the atlas_sculptor directory.
+        tools_dir (str): Normalized path to the atlas_sculptor directory.
         maya_scripts_dir (str): Path to Maya's scripts directory.
     """
-    atlas_dir = _norm(tools_dir)
-    parent_dir = _norm(os.path.dirname(atlas_dir))
+    atlas_dir = tools_dir
+    parent_dir = os.path.dirname(atlas_dir)
     icon_dir = _norm(os.path.join(atlas_dir, "setup", "icons"))
 
     user_py = os.path.join(maya_scripts_dir, "userSetup.py")
@@ -219,10 +233,14 @@ def write_usersetup_blocks(tools_dir: str, maya_scripts_dir: str) -> None:
     os.makedirs(maya_scripts_dir, exist_ok=True)
 
     # Write blocks (removes existing ones first)
-    _append_block(user_py, SCRIPT_MARKER, END_MARKER, py_block)
-    _append_block(user_py, ICON_MARKER, END_MARKER, icon_py_block)
-    _append_block(user_mel, SCRIPT_MARKER, END_MARKER, mel_block)
-    _append_block(user_mel, ICON_MARKER, END_MARKER, icon_mel_block)
+    _append_blocks(user_py, [
+        (SCRIPT_MARKER, END_MARKER, py_block),
+        (ICON_MARKER, END_MARKER, icon_py_block),
+    ])
+    _append_blocks(user_mel, [
+        (SCRIPT_MARKER, END_MARKER, mel_block),
+        (ICON_MARKER, END_MARKER, icon_mel_block),
+    ])
 
 
 def install_shelf(tools_dir: str, maya_prefs_dir: str) -> bool:
@@ -248,19 +266,18 @@ def install_shelf(tools_dir: str, maya_prefs_dir: str) -> bool:
 
     os.makedirs(dest_shelf_dir, exist_ok=True)
 
-    shelf_files = [f for f in os.listdir(source_shelf_dir) if f.startswith("shelf_")]
-    if not shelf_files:
+    with os.scandir(source_shelf_dir) as it:
+        entries = [e for e in it if e.is_file(follow_symlinks=False) and e.name.startswith("shelf_")]
+    if not entries:
         print(f"No shelf files found in {source_shelf_dir}")
         return False
 
-    for shelf_file in shelf_files:
-        src = os.path.join(source_shelf_dir, shelf_file)
-        dst = os.path.join(dest_shelf_dir, shelf_file)
+    for entry in entries:
         try:
-            shutil.copy2(src, dst)
-            print(f"Copied shelf: {shelf_file}")
+            shutil.copy2(entry.path, os.path.join(dest_shelf_dir, entry.name))
+            print(f"Copied shelf: {entry.name}")
         except Exception as e:
-            print(f"Failed to copy {shelf_file}: {e}")
+            print(f"Failed to copy {entry.name}: {e}")
             return False
 
     return True
@@ -281,16 +298,23 @@ def install_icons(atlas_dir: str, maya_prefs_dir: str) -> bool:
     dst = _norm(os.path.join(maya_prefs_dir, "prefs", "icons"))
     folder_name = "atlas_sculptor_icons"
 
-    if not os.path.isdir(src):
-        print(f"Icons source not found: {src}")
-        return False
-
-    os.makedirs(dst, exist_ok=True)
+    src_folder = os.path.join(src, folder_name)
+    dst_folder = os.path.join(dst, folder_name)
     copied = 0
 
+    # copytree creates dst and tolerates an existing install, so no pre-flight checks
     try:
-        shutil.copytree(os.path.join(src, folder_name), os.path.join(dst, folder_name))
+        try:
+            shutil.copytree(src_folder, dst_folder, dirs_exist_ok=True)
+        except TypeError:
+            # Python 3.7 (Maya 2022) has no dirs_exist_ok: replace the previous install
+            os.stat(src_folder)  # Never delete an existing install if the source is missing
+            shutil.rmtree(dst_folder, ignore_errors=True)
+            shutil.copytree(src_folder, dst_folder)
         copied += 1
+    except FileNotFoundError:
+        print(f"Icons source not found: {src}/{folder_name}")
+        return False
     except Exception as e:
         print(f"Failed to copy icon folder {folder_name}: {e}")
 
@@ -309,10 +333,10 @@ def _inject_runtime_paths_now(tools_dir: str) -> None:
     Adds script and icon paths to the current session's environment.
 
     Args:
-        tools_dir (str): Path to the atlas_sculptor directory.
+        tools_dir (str): Normalized path to the atlas_sculptor directory.
     """
-    atlas_dir = _norm(tools_dir)
-    parent_dir = _norm(os.path.dirname(atlas_dir))
+    atlas_dir = tools_dir
+    parent_dir = os.path.dirname(atlas_dir)
     icon_dir = _norm(os.path.join(atlas_dir, "setup", "icons"))
 
     # Python import path
@@ -357,6 +381,45 @@ def _load_shelf_now(shelf_name: str = "AtlasSculptor") -> None:
         traceback.print_exc()
 
 
+class _BufferedStream:
+    """
+    File-like object recording writes into a shared log, tagged with the
+    name of the sys stream they were meant for.
+
+    Args:
+        log (List[Tuple[str, str]]): Shared list of (stream_name, text) chunks.
+        stream_name (str): 'stdout' or 'stderr'.
+    """
+
+    def __init__(self, log: List[Tuple[str, str]], stream_name: str) -> None:
+        self._log = log
+        self._stream_name = stream_name
+
+    def write(self, text: str) -> int:
+        self._log.append((self._stream_name, text))
+        return len(text)
+
+    def flush(self) -> None:
+        pass
+
+
+def _flush_log(log: List[Tuple[str, str]]) -> None:
+    """
+    Replay a buffered log to the real sys streams, preserving order.
+
+    Consecutive chunks for the same stream are merged into a single write, so
+    a clean installation reaches the Script Editor as one stdout write while
+    tracebacks still go to stderr.
+
+    Args:
+        log (List[Tuple[str, str]]): (stream_name, text) chunks in write order.
+    """
+    for stream_name, chunks in groupby(log, key=lambda chunk: chunk[0]):
+        stream = getattr(sys, stream_name)
+        stream.write("".join(text for _, text in chunks))
+        stream.flush()
+
+
 # ---------- INSTALLATION ----------
 
 
@@ -372,8 +435,8 @@ def install() -> None:
     5. Loads shelf in current session
     """
     this_file = _norm(__file__)
-    atlas_dir = _norm(os.path.dirname(this_file))
-    parent_dir = _norm(os.path.dirname(atlas_dir))
+    atlas_dir = os.path.dirname(this_file)
+    parent_dir = os.path.dirname(atlas_dir)
     user_platform = get_os()
     maya_version = get_maya_version()
 
@@ -382,50 +445,59 @@ def install() -> None:
 
     os.makedirs(maya_scripts_dir, exist_ok=True)
 
-    print("=" * 60)
-    print("ATLAS MATRIX INSTALLATION")
-    print("=" * 60)
-
-    # Write idempotent userSetup blocks
-    write_usersetup_blocks(atlas_dir, maya_scripts_dir)
-
-    # Apply paths to the current session (no restart required)
-    _inject_runtime_paths_now(atlas_dir)
-
-    # Install shelf files
-    shelf_ok = install_shelf(atlas_dir, maya_prefs_dir)
-
-    # Install icons
-    icons_ok = install_icons(atlas_dir, maya_prefs_dir)
-
-    # Try to load the shelf right now
-    if shelf_ok:
-        _load_shelf_now("AtlasSculptor")
-
-    # Final dialog
-    parts = [
-        "Atlas Sculptor installed successfully!",
-        f"\nMaya Version: {maya_version}",
-        f"Scripts path: {maya_scripts_dir}",
-        f"Package dir (import root): {parent_dir}",
-        "\n✓ Script path configured",
-        "✓ Icon path configured",
-    ]
-
-    if shelf_ok:
-        parts.append("✓ Shelf files copied & loaded")
-    else:
-        parts.append("⚠ Shelf installation had issues (check Script Editor)")
-
-    if icons_ok:
-        parts.append("✓ Icon files copied")
-    else:
-        parts.append("⚠ Icon installation had issues (check Script Editor)")
-
-    print("\n" + "\n".join(parts))
-    print("=" * 60)
-
-    cmds.confirmDialog(title="Installation Complete", message="\n".join(parts), button=["OK"])
+    # Buffer the installation log, tracebacks included, and flush it to the
+    # Script Editor in order once the installation is done
+    log: List[Tuple[str, str]] = []
+    try:
+        with redirect_stdout(_BufferedStream(log, "stdout")), redirect_stderr(_BufferedStream(log, "stderr")):
+            print("=" * 60)
+            print("ATLAS MATRIX INSTALLATION")
+            print("=" * 60)
+
+            # Write idempotent userSetup blocks
+            write_usersetup_blocks(atlas_dir, maya_scripts_dir)
+
+            # Apply paths to the current session (no restart required)
+            _inject_runtime_paths_now(atlas_dir)
+
+            # Install shelf files
+            shelf_ok = install_shelf(atlas_dir, maya_prefs_dir)
+
+            # Install icons
+            icons_ok = install_icons(atlas_dir, maya_prefs_dir)
+
+            # Try to load the shelf right now
+            if shelf_ok:
+                _load_shelf_now("AtlasSculptor")
+
+            # Final dialog
+            parts = [
+                "Atlas Sculptor installed successfully!",
+                f"\nMaya Version: {maya_version}",
+                f"Scripts path: {maya_scripts_dir}",
+                f"Package dir (import root): {parent_dir}",
+                "\n✓ Script path configured",
+                "✓ Icon path configured",
+            ]
+
+            if shelf_ok:
+                parts.append("✓ Shelf files copied & loaded")
+            else:
+                parts.append("⚠ Shelf installation had issues (check Script Editor)")
+
+            if icons_ok:
+                parts.append("✓ Icon files copied")
+            else:
+                parts.append("⚠ Icon installation had issues (check Script Editor)")
+
+            message = "\n".join(parts)
+
+            print("\n" + message)
+            print("=" * 60)
+    finally:
+        _flush_log(log)
+
+    cmds.confirmDialog(title="Installation Complete", message=message, button=["OK"])
 
 
 def onMayaDroppedPythonFile(*args, **kwargs) -> None:
@@ -1,27 +1,10 @@
-from PySide6 import QtWidgets, QtCore
+from PySide6 import QtCore
 from PySide6.QtGui import QDoubleValidator
 
 import maya.cmds as cmds
 
 from atlas_sculptor.ui.main import AtlasShotSculptorUi
 
-def _delete_existing(object_name: str):
-    """
-    Close and delete any existing widget with a given object name.
-
-    Useful for ensuring a single instance of a dialog in Maya/Qt environments.
-
-    Args:
-        object_name (str): The `QObject.objectName()` to search for.
-
-    Side Effects:
-        - Closes matching widgets and schedules them for deletion.
-    """
-    for w in QtWidgets.QApplication.allWidgets():
-        if w.objectName() == object_name:
-            w.close()
-            w.deleteLater()
-
 
 DIALOG_ATTR = "_atlasShotSculptorDlg"
 
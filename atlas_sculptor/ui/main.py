@@ -34,6 +34,160 @@ from PySide6.QtGui import QPalette, QColor, QAction
 from shiboken6 import wrapInstance
 import maya.OpenMayaUI as omui
 
+# ---------- STYLESHEETS ----------
+
+_MAIN_QSS = """
+QWidget {
+    background-color: #303030;
+    color: #ddd;
+    font-family: Segoe UI;
+    font-size: 8pt;
+}
+QMenuBar:item:selected {
+    background-color: #7a53cf;
+    color: #ffffff;
+}
+QMenu::item:selected {
+    background-color: #7a53cf;
+    color: #fff;
+}
+QPushButton {
+    background-color: #404040;
+    border: 1px solid #262626;
+    border-radius: 4px;
+    padding: 4px 8px;
+}
+QPushButton:hover {
+    background-color: #404040;
+    border: 1px solid #7a53cf;
+    border-radius: 4px;
+    padding: 4px 8px;
+}
+QComboBox QAbstractItemView {
+    selection-background-color: #7a53cf;
+    selection-color: #ffffff;
+    background-color: #262626;
+}
+QComboBox:hover {
+    border: 1px solid #7a53cf;
+}
+QDoubleSpinBox:hover {
+    border: 1px solid #7a53cf;
+}
+QLineEdit, QComboBox, QDoubleSpinBox {
+    background-color: #404040;
+    border: 1px solid #555;
+    border-radius: 3px;
+    padding: 2px;
+}
+QGroupBox {
+    border: 1px solid #7a53cf;
+    border-radius: 5px;
+    margin-top: 6px;
+    padding: 4px;
+    font-weight: bold;
+}
+QFrame#line {
+    background-color: #303030;
+    border: 1px solid #303030;
+}
+"""
+
+_CREATE_BTN_QSS = """
+QPushButton {
+    background-color: #3C7837;
+    color: white;
+    border: none;
+    padding: 8px;
+    font-size: 10px;
+    font-weight: bold;
+}
+QPushButton:hover {
+    background-color: #3d7f3d;
+}
+"""
+
+_DELETE_BTN_QSS = """
+QPushButton {
+    background-color: #C44848;
+    color: white;
+    border: none;
+    padding: 8px;
+    font-size: 10px;
+    font-weight: bold;
+}
+QPushButton:hover {
+    background-color: #8d4040;
+}
+"""
+
+_DISPLAY_FRAME_QSS = """
+QFrame {
+    background-color: #262626;
+    border: 1px solid #7a53cf;
+    margin: 5px;
+}
+"""
+
+_GROUP_QSS = """
+QGroupBox {
+    color: #cccccc;
+    border: 1px solid #7a53cf;
+    border-radius: 5px;
+    margin-top: 10px;
+    padding: 4px;
+    font-weight: bold;
+}
+QGroupBox::title {
+    subcontrol-origin: margin;
+    left: 10px;
+    padding: 0 5px;
+}
+"""
+
+_SPINBOX_QSS = """
+QSpinBox {
+    background-color: #3a3a3a;
+    color: white;
+    border: 1px solid #555555;
+    padding: 3px;
+    font-size: 8px;
+}
+"""
+
+_COMBO_QSS = """
+QComboBox {
+    background-color: #3a3a3a;
+    color: white;
+    border: 1px solid #555555;
+    padding: 3px;
+    font-size: 10px;
+}
+QComboBox::drop-down {
+    border: none;
+}
+"""
+
+_LINEEDIT_QSS = """
+QLineEdit {
+    background-color: #262626;
+    color: white;
+    border: 1px solid #555555;
+    padding: 5px;
+    font-size: 10px;
+}
+"""
+
+_STATUS_QSS = """
+QLabel {
+    color: #888888;
+    padding: 5px;
+    font-size: 10px;
+}
+"""
+
+_LABEL_QSS = "color: #cccccc; font-size: 10px;"
+
 # ---------- MAYA UI ----------
 
 def get_maya_main_window():
@@ -48,62 +202,7 @@ class AtlasShotSculptorUi(QMainWindow):
         super().__init__(parent)
         self.setWindowTitle("Atlas Sculptor 1.0.0 - Maya")
         self.setGeometry(100, 100, 320, 480)
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #303030;
-                color: #ddd;
-                font-family: Segoe UI;
-                font-size: 8pt;
-            }
-            QMenuBar:item:selected {
-                background-color: #7a53cf;
-                color: #ffffff;
-            }
-            QMenu::item:selected {
-                background-color: #7a53cf;
-                color: #fff;
-            }
-            QPushButton {
-                background-color: #404040;
-                border: 1px solid #262626;
-                border-radius: 4px;
-                padding: 4px 8px;
-            }
-            QPushButton:hover {
-                background-color: #404040;
-                border: 1px solid #7a53cf;
-                border-radius: 4px;
-                padding: 4px 8px;
-            }
-            QComboBox QAbstractItemView {
-                selection-background-color: #7a53cf;  
-                selection-color: #ffffff;              
-                background-color: #262626;            
-            }
-            QComboBox:hover {
-                border: 1px solid #7a53cf;
-            }
-            QDoubleSpinBox:hover {
-                border: 1px solid #7a53cf;
-            }
-            QLineEdit, QComboBox, QDoubleSpinBox {
-                background-color: #404040;
-                border: 1px solid #555;
-                border-radius: 3px;
-                padding: 2px;
-            }
-            QGroupBox {
-                border: 1px solid #7a53cf;
-                border-radius: 5px;
-                margin-top: 6px;
-                padding: 4px;
-                font-weight: bold;
-            }
-            QFrame#line {
-                background-color: #303030;
-                border: 1px solid #303030;
-            }
-        """)
+        self.setStyleSheet(_MAIN_QSS)
 
         # Create central widget and main layout
         central_widget = QWidget()
@@ -141,35 +240,11 @@ class AtlasShotSculptorUi(QMainWindow):
         frame_btn_layout.setSpacing(2)
 
         create_frame_btn = QPushButton("Create Sculpt Frame")
-        create_frame_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3C7837;
-                color: white;
-                border: none;
-                padding: 8px;
-                font-size: 10px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #3d7f3d;
-            }
-        """)
+        create_frame_btn.setStyleSheet(_CREATE_BTN_QSS)
         frame_btn_layout.addWidget(create_frame_btn)
 
         delete_frame_btn = QPushButton("Delete Sculpt Frame")
-        delete_frame_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #C44848;
-                color: white;
-                border: none;
-                padding: 8px;
-                font-size: 10px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #8d4040;
-            }
-        """)
+        delete_frame_btn.setStyleSheet(_DELETE_BTN_QSS)
         frame_btn_layout.addWidget(delete_frame_btn)
 
         main_layout.addLayout(frame_btn_layout)
@@ -177,13 +252,7 @@ class AtlasShotSculptorUi(QMainWindow):
         # Large display area
         display_frame = QFrame()
         display_frame.setMinimumHeight(150)
-        display_frame.setStyleSheet("""
-            QFrame {
-                background-color: #262626;
-                border: 1px solid #7a53cf;
-                margin: 5px;
-            }
-        """)
+        display_frame.setStyleSheet(_DISPLAY_FRAME_QSS)
         main_layout.addWidget(display_frame)
 
         # Edit Frame button
@@ -197,21 +266,7 @@ class AtlasShotSculptorUi(QMainWindow):
 
         # Animation Settings Group
         settings_group = QGroupBox("Animation Settings")
-        settings_group.setStyleSheet("""
-            QGroupBox {
-                color: #cccccc;
-                border: 1px solid #7a53cf;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding: 4px;
-                font-weight: bold;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-        """)
+        settings_group.setStyleSheet(_GROUP_QSS)
         settings_layout = QVBoxLayout()
 
         # Ease In/Out, Hold In/Out controls
@@ -222,7 +277,7 @@ class AtlasShotSculptorUi(QMainWindow):
         labels = ["Ease In:", "Ease Out:", "Hold In:", "Hold Out:"]
         for label_text in labels:
             label = QLabel(label_text)
-            label.setStyleSheet("color: #cccccc; font-size: 10px;")
+            label.setStyleSheet(_LABEL_QSS)
             labels_layout.addWidget(label)
 
         settings_layout.addLayout(labels_layout)
@@ -234,15 +289,7 @@ class AtlasShotSculptorUi(QMainWindow):
             spinbox.setValue(default_val)
             spinbox.setMinimum(0)
             spinbox.setMaximum(999)
-            spinbox.setStyleSheet("""
-                QSpinBox {
-                    background-color: #3a3a3a;
-                    color: white;
-                    border: 1px solid #555555;
-                    padding: 3px;
-                    font-size: 8px;
-                }
-            """)
+            spinbox.setStyleSheet(_SPINBOX_QSS)
             spinboxes_layout.addWidget(spinbox)
 
         settings_layout.addLayout(spinboxes_layout)
@@ -251,23 +298,12 @@ class AtlasShotSculptorUi(QMainWindow):
         # Key Type dropdown
         key_type_layout = QHBoxLayout()
         key_type_label = QLabel("Key Type:")
-        key_type_label.setStyleSheet("color: #cccccc; font-size: 10px;")
+        key_type_label.setStyleSheet(_LABEL_QSS)
         key_type_layout.addWidget(key_type_label)
 
         key_type_combo = QComboBox()
         key_type_combo.addItems(["linear", "smooth", "step"])
-        key_type_combo.setStyleSheet("""
-            QComboBox {
-                background-color: #3a3a3a;
-                color: white;
-                border: 1px solid #555555;
-                padding: 3px;
-                font-size: 10px;
-            }
-            QComboBox::drop-down {
-                border: none;
-            }
-        """)
+        key_type_combo.setStyleSheet(_COMBO_QSS)
         key_type_layout.addWidget(key_type_combo)
 
         settings_layout.addLayout(key_type_layout)
@@ -281,15 +317,7 @@ class AtlasShotSculptorUi(QMainWindow):
 
         frame_name_input = QLineEdit()
         frame_name_input.setPlaceholderText("New frame name...")
-        frame_name_input.setStyleSheet("""
-            QLineEdit {
-                background-color: #262626;
-                color: white;
-                border: 1px solid #555555;
-                padding: 5px;
-                font-size: 10px;
-            }
-        """)
+        frame_name_input.setStyleSheet(_LINEEDIT_QSS)
         rename_layout.addWidget(frame_name_input, stretch=1)
 
         rename_btn = QPushButton("Rename Frame")
@@ -299,13 +327,7 @@ class AtlasShotSculptorUi(QMainWindow):
 
         # Status label
         status_label = QLabel("No frame selected")
-        status_label.setStyleSheet("""
-            QLabel {
-                color: #888888;
-                padding: 5px;
-                font-size: 10px;
-            }
-        """)
+        status_label.setStyleSheet(_STATUS_QSS)
         main_layout.addWidget(status_label)
 
         main_layout.addStretch()
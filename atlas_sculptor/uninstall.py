@@ -30,7 +30,7 @@ limitations under the License.
 import os
 import shutil
 import platform
-from typing import List
+from typing import List, Tuple
 
 import maya.cmds as cmds
 
@@ -40,6 +40,15 @@ SCRIPT_MARKER = "# ATLAS_SCULPTOR_SCRIPT_PATH"
 ICON_MARKER = "# ATLAS_SCULPTOR_ICON_PATH"
 END_MARKER = "# END_ATLAS_SCULPTOR"
 
+# Shelf files installed by Atlas Sculptor (shelf_AtlasSculptor* and legacy shelf_Atlas*)
+_SHELF_PREFIXES = ("shelf_AtlasSculptor", "shelf_Atlas")
+_SHELF_EXTS = (".mel", ".json")
+_SHELF_MIN_LEN = len("shelf_Atlas.mel")  # Shortest name that can match
+
+# Resolved once per session
+_OS = platform.system()
+_MAYA_VERSION = None
+
 
 # ---------- FUNCTIONS ----------
 
@@ -64,17 +73,20 @@ def get_os() -> str:
     Returns:
         str: 'Windows', 'Darwin' (macOS), or 'Linux'.
     """
-    return platform.system()
+    return _OS
 
 
 def get_maya_version() -> str:
     """
-    Get the current Maya version.
+    Get the current Maya version, queried from Maya on first call only.
 
     Returns:
         str: Maya version string (e.g., '2024', '2025').
     """
-    return cmds.about(version=True)
+    global _MAYA_VERSION
+    if _MAYA_VERSION is None:
+        _MAYA_VERSION = cmds.about(version=True)
+    return _MAYA_VERSION
 
 
 def get_maya_prefs_dir(maya_version: str, user_platform: str) -> str:
@@ -94,9 +106,10 @@ def get_maya_prefs_dir(maya_version: str, user_platform: str) -> str:
         onedrive_path = os.path.join(user_profile, "OneDrive", "Documents", "maya", maya_version)
         local_path = os.path.join(user_profile, "Documents", "maya", maya_version)
 
-        if os.path.exists(onedrive_path):
+        try:
+            os.stat(onedrive_path)
             return onedrive_path
-        else:
+        except OSError:
             return local_path
     elif user_platform == "Darwin":  # Mac
         return os.path.expanduser(f"~/Library/Preferences/Autodesk/maya/{maya_version}")
@@ -118,38 +131,58 @@ def remove_marked_block(filepath: str, start_marker: str, end_marker: str) -> bo
     Returns:
         bool: True if block was found and removed, False otherwise.
     """
-    if not os.path.exists(filepath):
-        print(f"File not found: {filepath}")
-        return True  # Nothing to remove, consider it success
+    return remove_marked_blocks(filepath, [(start_marker, end_marker)])
+
+
+def remove_marked_blocks(filepath: str, pairs: List[Tuple[str, str]]) -> bool:
+    """
+    Remove several marked blocks from a userSetup file in one read and one write.
+
+    For each (start_marker, end_marker) pair, removes all lines between the
+    markers (inclusive). The file is left untouched if no block is found.
+
+    Args:
+        filepath (str): Path to the file to modify.
+        pairs (List[Tuple[str, str]]): (start_marker, end_marker) pairs identifying blocks.
 
+    Returns:
+        bool: True if blocks were removed or none were present, False on error.
+    """
     try:
         with open(filepath, "r", encoding="utf-8") as f:
-            lines = f.readlines()
-
-        new_lines = []
-        skip_mode = False
-        found_marker = False
-
-        for line in lines:
-            if start_marker in line:
-                skip_mode = True
-                found_marker = True
-                continue
-            if skip_mode and end_marker in line:
-                skip_mode = False
-                continue
-            if not skip_mode:
-                new_lines.append(line)
-
-        if found_marker:
-            with open(filepath, "w", encoding="utf-8") as f:
-                f.writelines(new_lines)
-            print(f"Removed Atlas Sculptor block from {os.path.basename(filepath)}")
-            return True
-        else:
+            text = f.read()
+
+        dirty = False
+
+        for start_marker, end_marker in pairs:
+            while True:
+                start = text.find(start_marker)
+                if start == -1:
+                    break
+                dirty = True
+                # Splice out whole lines, from the start marker line to the end marker line
+                line_start = text.rfind("\n", 0, start) + 1
+                end = text.find(end_marker, text.find("\n", start) + 1 or len(text))
+                if end == -1:
+                    # Unterminated block runs to end of file
+                    text = text[:line_start]
+                    break
+                line_end = text.find("\n", end) + 1 or len(text)
+                text = text[:line_start] + text[line_end:]
+
+        if not dirty:
             print(f"No Atlas Sculptor block found in {os.path.basename(filepath)}")
             return True
 
+        # Rewrite in place so symlinked userSetup files and their permissions are kept
+        with open(filepath, "w", encoding="utf-8") as f:
+            f.write(text)
+        print(f"Removed Atlas Sculptor blocks from {os.path.basename(filepath)}")
+        return True
+
+    except FileNotFoundError:
+        print(f"File not found: {filepath}")
+        return True  # Nothing to remove, consider it success
     except Exception as e:
         print(f"Failed to process {filepath}: {e}")
         return False
@@ -168,7 +201,7 @@ def remove_shelf(maya_prefs_dir: str) -> bool:
     Returns:
         bool: True if removal succeeded or nothing to remove, False on error.
     """
-    dest_shelf_dir = os.path.join(maya_prefs_dir, "prefs", "shelves")
+    dest_shelf_dir = f"{maya_prefs_dir}/prefs/shelves"
 
     print(f"Checking shelf directory: {dest_shelf_dir}")
 
@@ -183,25 +216,27 @@ def remove_shelf(maya_prefs_dir: str) -> bool:
                 print(f"Failed to delete shelf UI '{shelf_ui}': {e}")
 
     # Remove files from disk
-    if not os.path.exists(dest_shelf_dir):
-        print(f"Shelf directory not found: {dest_shelf_dir}")
-        return True
-
-    shelf_files = os.listdir(dest_shelf_dir)
-    shelf_prefixes = ["shelf_AtlasSculptor", "shelf_Atlas"]
-    valid_extensions = [".mel", ".json"]
     removed_count = 0
 
-    for shelf_file in shelf_files:
-        if any(shelf_file.startswith(prefix) and shelf_file.endswith(ext)
-               for prefix in shelf_prefixes for ext in valid_extensions):
-            shelf_path = os.path.join(dest_shelf_dir, shelf_file)
-            try:
-                os.remove(shelf_path)
-                print(f"Removed shelf file: {shelf_file}")
-                removed_count += 1
-            except Exception as e:
-                print(f"Failed to remove {shelf_file}: {e}")
+    try:
+        with os.scandir(dest_shelf_dir) as it:
+            for entry in it:
+                name = entry.name
+                if (len(name) < _SHELF_MIN_LEN
+                        or not name.startswith(_SHELF_PREFIXES)
+                        or not name.endswith(_SHELF_EXTS)):
+                    continue
+                if not entry.is_file():
+                    continue
+                try:
+                    os.unlink(entry.path)
+                    print(f"Removed shelf file: {entry.name}")
+                    removed_count += 1
+                except Exception as e:
+                    print(f"Failed to remove {entry.name}: {e}")
+    except FileNotFoundError:
+        print(f"Shelf directory not found: {dest_shelf_dir}")
+        return True
 
     if removed_count == 0:
         print("No matching Atlas Sculptor shelf files found to remove")
@@ -222,33 +257,21 @@ def remove_icons(maya_prefs_dir: str) -> bool:
     Returns:
         bool: True if removal succeeded or nothing to remove, False on error.
     """
-    icons_dir = os.path.join(maya_prefs_dir, "prefs", "icons")
+    icons_dir = f"{maya_prefs_dir}/prefs/icons"
     folder_name = "atlas_sculptor_icons"
+    icon_path = f"{icons_dir}/{folder_name}"
 
-    if not os.path.exists(icons_dir):
-        print(f"Icons directory not found: {icons_dir}")
+    # Probe the icon folder itself rather than its parent before handing it to rmtree
+    if not os.path.isdir(icon_path):
+        print("No Atlas Sculptor icons found to remove")
         return True
 
-    removed_count = 0
-
     try:
-        icon_path = os.path.join(icons_dir, folder_name)
-        try:
-            shutil.rmtree(icon_path)
-            print(f"Removed icon: {folder_name}")
-            removed_count += 1
-        except Exception as e:
-            print(f"Failed to remove icon {folder_name}: {e}")
-
-        if removed_count == 0:
-            print("No Atlas Sculptor icons found to remove")
-        else:
-            print(f"Removed {removed_count} icon file(s)")
-
+        shutil.rmtree(icon_path)
+        print(f"Removed icon: {folder_name}")
         return True
-
     except Exception as e:
-        print(f"Error processing icons directory: {e}")
+        print(f"Failed to remove icon {folder_name}: {e}")
         return False
 
 
@@ -272,44 +295,44 @@ def uninstall() -> None:
     print("ATLAS SCULPTOR UNINSTALLATION")
     print("=" * 60)
 
-    success_list: List[bool] = []
-
-    # Remove script path blocks from userSetup files
-    mel_file = os.path.join(maya_scripts_dir, "userSetup.mel")
-    py_file = os.path.join(maya_scripts_dir, "userSetup.py")
-
-    success_list.append(remove_marked_block(mel_file, SCRIPT_MARKER, END_MARKER))
-    success_list.append(remove_marked_block(py_file, SCRIPT_MARKER, END_MARKER))
-
-    # Remove icon path blocks from userSetup files
-    success_list.append(remove_marked_block(mel_file, ICON_MARKER, END_MARKER))
-    success_list.append(remove_marked_block(py_file, ICON_MARKER, END_MARKER))
-
-    # Remove shelf
-    success_list.append(remove_shelf(maya_prefs_dir))
-
-    # Remove icons
-    success_list.append(remove_icons(maya_prefs_dir))
-
-    # Build result message
-    all_success = all(success_list)
-
     message_parts = [
         f"Atlas Sculptor Uninstallation Complete!",
         f"\nMaya Version: {maya_version}",
         f"Script directory: {maya_scripts_dir}",
     ]
 
-    if all_success:
-        message_parts.append("\n✓ Script paths removed from userSetup files")
-        message_parts.append("✓ Icon paths removed from userSetup files")
-        message_parts.append("✓ Shelf files removed")
-        message_parts.append("✓ Icon files removed")
-        message_parts.append("\n⚠ Please restart Maya to complete uninstallation.")
-        message_parts.append("\nNote: The Atlas Sculptor tool files themselves were not deleted.")
-        message_parts.append("You can safely delete the atlas_sculptor folder manually if desired.")
+    if not os.path.isdir(maya_prefs_dir):
+        # Nothing can have been installed without a prefs directory
+        message_parts.append(f"\nNo Maya prefs directory found at {maya_prefs_dir}")
+        message_parts.append("Nothing to uninstall.")
     else:
-        message_parts.append("\n⚠ Some steps encountered issues (check Script Editor for details)")
+        all_success = True
+
+        # Remove script and icon path blocks from userSetup files
+        mel_file = os.path.join(maya_scripts_dir, "userSetup.mel")
+        py_file = os.path.join(maya_scripts_dir, "userSetup.py")
+
+        marker_pairs = [(SCRIPT_MARKER, END_MARKER), (ICON_MARKER, END_MARKER)]
+        all_success &= remove_marked_blocks(mel_file, marker_pairs)
+        all_success &= remove_marked_blocks(py_file, marker_pairs)
+
+        # Remove shelf
+        all_success &= remove_shelf(maya_prefs_dir)
+
+        # Remove icons
+        all_success &= remove_icons(maya_prefs_dir)
+
+        # Build result message
+        if all_success:
+            message_parts.append("\n✓ Script paths removed from userSetup files")
+            message_parts.append("✓ Icon paths removed from userSetup files")
+            message_parts.append("✓ Shelf files removed")
+            message_parts.append("✓ Icon files removed")
+            message_parts.append("\n⚠ Please restart Maya to complete uninstallation.")
+            message_parts.append("\nNote: The Atlas Sculptor tool files themselves were not deleted.")
+            message_parts.append("You can safely delete the atlas_sculptor folder manually if desired.")
+        else:
+            message_parts.append("\n⚠ Some steps encountered issues (check Script Editor for details)")
 
     print("\n" + "\n".join(message_parts))
     print("=" * 60)